@@ -0,0 +1,74 @@
+"""Authentication classes used by the API.
+
+CachedTokenAuthentication is a drop-in replacement for DRF's
+TokenAuthentication that keeps resolved token -> user lookups in Django's
+cache for a short time. Entries are dropped by the signal handlers in
+auth_app.signals whenever the user, its profile or its token changes.
+
+Only the few user fields request handling relies on (id, username, the
+active/staff/superuser flags and the profile type) are cached; the
+password hash and email never leave the database.
+"""
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from auth_app.cache_keys import token_cache_key
+from auth_app.models import Profile
+
+
+# User columns kept in the cache; everything else stays deferred
+CACHED_USER_FIELDS = ('id', 'username', 'is_active', 'is_staff', 'is_superuser')
+
+
+def _from_values(model, values):
+    """Instantiate `model` as loaded from the database with only `values` set.
+
+    Model.from_db() expects values in concrete field order; fields that are
+    not given stay deferred.
+    """
+    names = [f.attname for f in model._meta.concrete_fields if f.attname in values]
+    return model.from_db(model.objects.db, names, [values[name] for name in names])
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """TokenAuthentication with a cache-aside lookup of the token's user."""
+
+    def authenticate_credentials(self, key):
+        model = self.get_model()
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            try:
+                token = model.objects.select_related('user', 'user__profile').get(key=key)
+            except model.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            profile = getattr(token.user, 'profile', None)
+            cached = (
+                {field: getattr(token.user, field) for field in CACHED_USER_FIELDS},
+                profile.type if profile is not None else None,
+            )
+            cache.set(cache_key, cached, timeout=getattr(settings, 'AUTH_TOKEN_CACHE_TTL', 60))
+
+        user = self._build_user(*cached)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+
+        token = _from_values(model, {'key': key, 'user_id': user.pk})
+        model.user.field.set_cached_value(token, user)
+        return (user, token)
+
+    def _build_user(self, user_values, profile_type):
+        # Deferred instance: other fields load lazily, save() only writes loaded ones
+        user = _from_values(User, user_values)
+        profile = None
+        if profile_type is not None:
+            profile = _from_values(Profile, {'user_id': user.pk, 'type': profile_type})
+            Profile.user.field.set_cached_value(profile, user)
+        # Cache the reverse relation (or its absence) so user.profile needs no query
+        User.profile.related.set_cached_value(user, profile)
+        return user
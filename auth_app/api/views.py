@@ -1,8 +1,12 @@
 """Views providing registration, login and profile listing/updating.
 
-Only comments and docstrings are added here. The view logic is unchanged.
+Registration and login put throttled clients on the blacklist checked by
+auth_app.middleware.ThrottleBlacklistMiddleware.
 """
 
+import math
+
+from django.core.cache import cache
 from rest_framework import status, generics
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -18,9 +22,22 @@ from .serializers import (
     ProfileCustomerSerializer,
 )
 from .permissions import IsOwnerProfile
+from auth_app.cache_keys import profile_cache_key
+from auth_app.middleware import blacklist
+
+
+class ThrottleBlacklistMixin:
+    """Blacklist throttled clients so ThrottleBlacklistMiddleware rejects
+    their next requests before routing and view setup.
+    """
 
+    def throttled(self, request, wait):
+        if wait:
+            blacklist(request, timeout=math.ceil(wait))
+        super().throttled(request, wait)
 
-class RegistrationView(APIView):
+
+class RegistrationView(ThrottleBlacklistMixin, APIView):
     """Public endpoint to register a new user and profile.
 
     POST: expects the RegistrationSerializer payload. Returns a token on
@@ -50,7 +67,7 @@ class RegistrationView(APIView):
         )
 
 
-class LoginView(ObtainAuthToken):
+class LoginView(ThrottleBlacklistMixin, ObtainAuthToken):
     """Token login view that returns token + basic user info on success."""
 
     permission_classes = [AllowAny]
@@ -80,25 +97,37 @@ class ProfileDetailView(generics.RetrieveUpdateAPIView):
     everyone but restricts PATCH to the profile owner.
     """
 
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related("user")
     serializer_class = ProfileSerializer
     permission_classes = [IsOwnerProfile]
     http_method_names = ["get", "patch", "head", "options"]
+    cache_timeout = 300
+
+    def retrieve(self, request, *args, **kwargs):
+        # Cache-aside: entries are dropped by auth_app.signals on changes.
+        # Object permission allows every safe method, so a hit may skip it.
+        key = profile_cache_key(kwargs["pk"])
+        data = cache.get(key)
+        if data is None:
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            # Cache the relative file URL; the absolute one depends on the requester's host
+            data = {**data, "file": instance.file.url if instance.file else data["file"]}
+            cache.set(key, data, timeout=self.cache_timeout)
+        if data["file"]:
+            data = {**data, "file": request.build_absolute_uri(data["file"])}
+        return Response(data)
 
 
 class ProfileBusinessView(generics.ListAPIView):
     """List profiles with type='business'."""
 
+    queryset = Profile.objects.filter(type="business").select_related("user")
     serializer_class = ProfileBusinessSerializer
 
-    def get_queryset(self):
-        return Profile.objects.filter(type="business")
-
 
 class ProfileCustomerView(generics.ListAPIView):
     """List profiles with type='customer'."""
 
-    serializer_class = ProfileCustomerSerializer
-
-    def get_queryset(self):
-        return Profile.objects.filter(type="customer")
\ No newline at end of file
+    queryset = Profile.objects.filter(type="customer").select_related("user")
+    serializer_class = ProfileCustomerSerializer
\ No newline at end of file
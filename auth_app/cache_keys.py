@@ -0,0 +1,17 @@
+"""Cache keys shared by auth_app's cached lookups and their invalidation.
+
+Kept in a dependency-free module so auth_app.signals can build keys
+without importing views, serializers or middleware.
+"""
+
+import hashlib
+
+
+def token_cache_key(key):
+    """Return the cache key for a token; the raw token is never stored as key."""
+    return f"authtok:{hashlib.sha256(key.encode()).hexdigest()}"
+
+
+def profile_cache_key(pk):
+    """Cache key of the serialized profile detail for the given user id."""
+    return f"profile:{pk}"
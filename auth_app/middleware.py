@@ -0,0 +1,56 @@
+"""Middleware for auth_app.
+
+ThrottleBlacklistMiddleware rejects clients that were recently throttled
+on the registration/login endpoints before the request reaches Django's
+auth stack or DRF. Clients are put on the blacklist by the views (see
+`ThrottleBlacklistMixin` in auth_app.api.views) when DRF throttles them.
+"""
+
+import hashlib
+import math
+import time
+
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.urls import reverse
+from rest_framework.throttling import BaseThrottle
+
+
+def blacklist_cache_key(request):
+    """Cache key for the client/path pair, using DRF's throttle client ident."""
+    ident = BaseThrottle().get_ident(request)
+    digest = hashlib.sha256(f"{ident}:{request.path}".encode()).hexdigest()
+    return f"throttle:blacklist:{digest}"
+
+
+def blacklist(request, timeout):
+    """Reject further requests of this client to this path for `timeout` seconds."""
+    cache.set(blacklist_cache_key(request), time.time() + timeout, timeout=timeout)
+
+
+class ThrottleBlacklistMiddleware:
+    """Answer 429 for blacklisted client/path pairs without running the view."""
+
+    # URL names of the throttled auth endpoints that can be blacklisted
+    url_names = ('registration', 'login')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self._paths = None
+
+    @property
+    def paths(self):
+        # Resolved on first use so the URLconf is not imported at startup
+        if self._paths is None:
+            self._paths = frozenset(reverse(name) for name in self.url_names)
+        return self._paths
+
+    def __call__(self, request):
+        # Only POSTs to the throttled auth endpoints ever put entries on the list
+        if request.method == 'POST' and request.path in self.paths:
+            expires_at = cache.get(blacklist_cache_key(request))
+            if expires_at is not None:
+                response = JsonResponse({'detail': 'Request was throttled.'}, status=429)
+                response['Retry-After'] = str(max(1, math.ceil(expires_at - time.time())))
+                return response
+        return self.get_response(request)
@@ -0,0 +1,48 @@
+"""Signal handlers for auth_app.
+
+They drop cached token lookups (see auth_app.api.authentication) and
+cached profile details (see ProfileDetailView) whenever the cached data
+changes: the user, its profile or the token itself.
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from auth_app.cache_keys import profile_cache_key, token_cache_key
+from auth_app.models import Profile
+
+
+def forget_user_tokens(user_id):
+    """Remove every cached token entry that belongs to the given user."""
+    keys = Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    if not created:
+        forget_user_tokens(instance.pk)
+        cache.delete(profile_cache_key(instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def user_deleted(sender, instance, **kwargs):
+    cache.delete(profile_cache_key(instance.pk))
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def profile_changed(sender, instance, created=False, **kwargs):
+    if not created:
+        forget_user_tokens(instance.user_id)
+        cache.delete(profile_cache_key(instance.user_id))
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def token_changed(sender, instance, **kwargs):
+    # Deleting a user cascades to its token, which lands here as well
+    cache.delete(token_cache_key(instance.key))
@@ -0,0 +1,71 @@
+from django.urls import reverse
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.authtoken.models import Token
+from django.contrib.auth.models import User
+from auth_app.models import Profile
+from auth_app.cache_keys import token_cache_key
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='tokenuser', email='tokenuser@example.com', password='x'
+        )
+        cls.profile = Profile.objects.create(user=cls.user, type='business')
+        cls.token = Token.objects.create(user=cls.user)
+        cls.url = reverse('profile-business-list')
+
+    def setUp(self):
+        cache.clear()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_second_request_skips_token_lookup(self):
+        self.client.get(self.url)
+
+        # Only the profile list query remains once the token is cached
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalid_token_401(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token invalid')
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deactivated_user_401_after_save(self):
+        self.client.get(self.url)
+
+        self.user.is_active = False
+        self.user.save()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_deleted_token_401(self):
+        self.client.get(self.url)
+
+        self.token.delete()
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cache_entry_holds_no_password_or_email(self):
+        self.client.get(self.url)
+
+        cached = cache.get(token_cache_key(self.token.key))
+        self.assertIsNotNone(cached)
+        self.assertNotIn(self.user.password, repr(cached))
+        self.assertNotIn(self.user.email, repr(cached))
+
+    def test_cached_user_exposes_profile_type_without_query(self):
+        orders_url = reverse('order-list')
+        self.client.get(orders_url)
+
+        # The order list reads request.user.profile.type; only the order query runs
+        with self.assertNumQueries(1):
+            response = self.client.get(orders_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,8 +1,12 @@
+from unittest.mock import patch
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
+from rest_framework.throttling import ScopedRateThrottle
 from auth_app.models import Profile
+from auth_app.api.views import LoginView
 
 
 class LoginHappyPathTests(APITestCase):
@@ -67,3 +71,31 @@ class LoginValidationTests(APITestCase):
         }
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class LoginThrottleTests(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="user1", password="password1", email="user1@example.com")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_throttled_client_is_rejected_by_middleware(self):
+        url = reverse('login')
+        data = {
+            'username': 'user1',
+            'password': 'password1'
+        }
+        with patch.dict(ScopedRateThrottle.THROTTLE_RATES, {'auth_login': '1/minute'}):
+            self.assertEqual(self.client.post(url, data).status_code, status.HTTP_200_OK)
+            self.assertEqual(self.client.post(url, data).status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+            with patch.object(LoginView, 'post') as view_post:
+                response = self.client.post(url, data)
+            self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+            self.assertGreater(int(response['Retry-After']), 0)
+            view_post.assert_not_called()
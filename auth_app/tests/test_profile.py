@@ -1,4 +1,5 @@
 from django.urls import reverse
+from django.core.cache import cache
 from rest_framework import status
 from rest_framework.test import APITestCase
 from django.contrib.auth.models import User
@@ -25,6 +26,7 @@ class ProfileHappyPathTests(APITestCase):
         cls.other_profile = Profile.objects.create(user=cls.other_user, type='business')
 
     def setUp(self):
+        cache.clear()
         self.client.force_authenticate(user=self.user)
 
     def test_get_own_profile(self):
@@ -41,6 +43,35 @@ class ProfileHappyPathTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data, ProfileSerializer(self.other_profile).data)
 
+    def test_get_profile_is_served_from_cache(self):
+        url = reverse('profile-detail', kwargs={'pk': self.user_profile.user_id})
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, ProfileSerializer(self.user_profile).data)
+
+    def test_get_profile_after_patch_is_fresh(self):
+        url = reverse('profile-detail', kwargs={'pk': self.user_profile.user_id})
+        self.client.get(url)
+
+        self.client.patch(url, {'location': 'fresh location', 'first_name': 'fresh'})
+        response = self.client.get(url)
+        self.assertEqual(response.data['location'], 'fresh location')
+        self.assertEqual(response.data['first_name'], 'fresh')
+
+    def test_get_cached_profile_file_url_uses_current_host(self):
+        self.user_profile.file = SimpleUploadedFile("cached.jpg", b"abc", content_type="image/jpeg")
+        self.user_profile.save()
+        url = reverse('profile-detail', kwargs={'pk': self.user_profile.user_id})
+
+        first = self.client.get(url)
+        self.assertTrue(first.data['file'].startswith('http://testserver/media/profile/'))
+
+        second = self.client.get(url, HTTP_HOST='localhost')
+        self.assertTrue(second.data['file'].startswith('http://localhost/media/profile/'))
+
     def test_get_profile_fields_empty(self):
         url = reverse('profile-detail', kwargs={'pk': self.user_profile.user_id})
 
@@ -140,6 +171,17 @@ class ProfileHappyPathTests(APITestCase):
         self.assertNotIn('description', response.data[0])
         self.assertNotIn('working_hours', response.data[0])
 
+    def test_business_profiles_list_uses_single_query(self):
+        for i in range(3):
+            extra = User.objects.create_user(username=f'biz{i}', email=f'biz{i}@example.com', password='x')
+            Profile.objects.create(user=extra, type='business')
+
+        url = reverse('profile-business-list')
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 4)
+
     def test_upload_file_sets_uploaded_at(self):
         url = reverse('profile-detail', kwargs={'pk': self.user_profile.user_id})
         upload = SimpleUploadedFile("avatar.jpg", b"file_content", content_type="image/jpeg")
@@ -211,6 +253,7 @@ class ProfileValidationTests(APITestCase):
         cls.user_profile = Profile.objects.create(user=cls.user, type='customer')
 
     def setUp(self):
+        cache.clear()
         self.client.force_authenticate(user=self.user)
 
     def test_get_unknown_profile(self):
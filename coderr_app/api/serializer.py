@@ -5,15 +5,98 @@ reviews. Most validation (for example: exactly three OfferDetail entries
 with unique offer_type values) happens here to keep models thin.
 """
 
+import copy
+from collections.abc import Mapping
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from rest_framework import serializers
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.settings import api_settings
+from rest_framework.utils import html
+from rest_framework.exceptions import ErrorDetail, PermissionDenied
 from coderr_app.models import Offer, OfferDetail, Order, Review
 from django.contrib.auth.models import User
 
+# Every offer must have exactly one detail of each of these types
+_REQUIRED_OFFER_TYPES = frozenset(('basic', 'standard', 'premium'))
+
+# The only field an order status update may change
+_ORDER_STATUS_ALLOWED = frozenset(('status',))
+
+# --- MIXINS ---
+
+
+class SerializerFieldsCacheMixin:
+    """Build a serializer class's fields once and hand out copies.
+
+    ModelSerializer.get_fields() introspects the model and instantiates
+    every field on each serializer instance. The result only depends on
+    the class, so it is cached per class and each instance gets a deep
+    copy to bind, just like DRF already does for declared fields.
+    """
+
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = SerializerFieldsCacheMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            SerializerFieldsCacheMixin._fields_cache[cls] = fields
+        return copy.deepcopy(fields)
+
+
+# --- FIELDS ---
+
+
+class _FeaturesField(serializers.ListField):
+    """Non-empty list of non-blank strings, checked in a single pass.
+
+    Coerces items like CharField does, then runs only the child's
+    validators (NUL/surrogate characters) instead of the full per-item
+    run_validation() pipeline.
+    """
+
+    child = serializers.CharField()
+
+    def to_internal_value(self, data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+        if isinstance(data, (str, Mapping)) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not data and not self.allow_empty:
+            self.fail('empty')
+
+        features = []
+        errors = {}
+        messages = self.child.error_messages
+        for idx, item in enumerate(data):
+            # Same coercion rules as CharField: strings and numbers, trimmed
+            if item is None:
+                errors[idx] = [ErrorDetail(messages['null'], code='null')]
+                continue
+            if isinstance(item, bool) or not isinstance(item, (str, int, float)):
+                errors[idx] = [ErrorDetail(messages['invalid'], code='invalid')]
+                continue
+            value = str(item).strip()
+            if not value:
+                errors[idx] = [ErrorDetail(messages['blank'], code='blank')]
+                continue
+            try:
+                self.child.run_validators(value)
+            except serializers.ValidationError as exc:
+                errors[idx] = exc.detail
+                continue
+            features.append(value)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return features
+
+
 # --- CREATE and UPDATE SERIALIZERS ---
 
 
-class OfferDetailItemNestedSerializer(serializers.ModelSerializer):
+class OfferDetailItemNestedSerializer(SerializerFieldsCacheMixin, serializers.ModelSerializer):
     """Nested serializer used when creating/updating Offer details.
 
     It applies simple min-value validation and requires a non-empty
@@ -23,9 +106,7 @@ class OfferDetailItemNestedSerializer(serializers.ModelSerializer):
     revisions = serializers.IntegerField(min_value=0)
     delivery_time_in_days = serializers.IntegerField(min_value=1)
     price = serializers.IntegerField(min_value=0)
-    features = serializers.ListField(
-        child=serializers.CharField(), allow_empty=False
-    )
+    features = _FeaturesField(allow_empty=False)
 
     class Meta:
         model = OfferDetail
@@ -44,7 +125,7 @@ class OfferDetailItemNestedSerializer(serializers.ModelSerializer):
         }
 
 
-class OfferSerializer(serializers.ModelSerializer):
+class OfferSerializer(SerializerFieldsCacheMixin, serializers.ModelSerializer):
     """Serializer for creating/updating an Offer with nested details.
 
     The validate() method enforces exactly three detail items on creation
@@ -66,9 +147,9 @@ class OfferSerializer(serializers.ModelSerializer):
             if not details or len(details) != 3:
                 raise serializers.ValidationError(
                     "Exactly 3 details must be provided.")
-            required = {'basic', 'standard', 'premium'}
-            types = [d.get('offer_type') for d in details]
-            if set(types) != required or len(types) != len(set(types)):
+            # Three details covering all three types implies no duplicates
+            types = frozenset(d.get('offer_type') for d in details)
+            if types != _REQUIRED_OFFER_TYPES:
                 raise serializers.ValidationError(
                     "Each offer_type (basic, standard, premium) must appear exactly once."
                 )
@@ -76,28 +157,34 @@ class OfferSerializer(serializers.ModelSerializer):
             # On update, if details are provided ensure no duplicate types
             details = attrs.get('details')
             if details:
-                # Ensure each provided detail includes offer_type (required on patch too)
-                missing_offer_type = [d for d in details if 'offer_type' not in d]
-                if missing_offer_type:
-                    raise serializers.ValidationError(
-                        "Each detail must include 'offer_type'."
-                    )
-                types = [d.get('offer_type') for d in details]
-                if len(types) != len(set(types)):
-                    raise serializers.ValidationError(
-                        "Duplicate offer_type values are not allowed."
-                    )
+                # Each detail needs an offer_type (required on patch too) and
+                # may not repeat one; both are checked in a single pass
+                seen = set()
+                for detail in details:
+                    offer_type = detail.get('offer_type')
+                    if offer_type is None:
+                        raise serializers.ValidationError(
+                            "Each detail must include 'offer_type'."
+                        )
+                    if offer_type in seen:
+                        raise serializers.ValidationError(
+                            "Duplicate offer_type values are not allowed."
+                        )
+                    seen.add(offer_type)
         return attrs
 
+    @transaction.atomic
     def create(self, validated_data):
         # Create the Offer and its nested details
         detail_data = validated_data.pop('details')
 
         offer = Offer.objects.create(**validated_data)
-        for detail in detail_data:
-            OfferDetail.objects.create(offer=offer, **detail)
+        OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **detail) for detail in detail_data]
+        )
         return offer
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         # Update the offer fields and patch existing details by offer_type
         detail_data = validated_data.pop('details', None)
@@ -109,11 +196,13 @@ class OfferSerializer(serializers.ModelSerializer):
         instance.save()
 
         if detail_data:
+            # Load all details once and patch them in memory by offer_type
+            existing = {d.offer_type: d for d in instance.details.all()}
+            changed = []
+            fields = set()
             for detail in detail_data:
-                try:
-                    single_detail = instance.details.get(
-                        offer_type=detail['offer_type'])
-                except OfferDetail.DoesNotExist:
+                single_detail = existing.get(detail['offer_type'])
+                if single_detail is None:
                     raise serializers.ValidationError(
                         f"Detail with offer_type '{detail['offer_type']}' does not exist."
                     )
@@ -121,7 +210,10 @@ class OfferSerializer(serializers.ModelSerializer):
                     if attr == 'offer_type':
                         continue
                     setattr(single_detail, attr, value)
-                single_detail.save()
+                    fields.add(attr)
+                changed.append(single_detail)
+            if fields:
+                OfferDetail.objects.bulk_update(changed, sorted(fields))
 
         return instance
 
@@ -232,10 +324,9 @@ class OrderStatusUpdateSerializer(OrderSerializer):
 
     def validate(self, attrs):
         # Only allow updating the `status` field via this serializer
-        allowed = {'status'}
-        forbidden = set(attrs.keys()) - allowed
+        forbidden = attrs.keys() - _ORDER_STATUS_ALLOWED
         if forbidden:
-            raise serializers.ValidationError(f"Forbidden fields: {', '.join(forbidden)}")
+            raise serializers.ValidationError(f"Forbidden fields: {', '.join(sorted(forbidden))}")
         if not attrs:
             raise serializers.ValidationError("No data provided.")
         return attrs
@@ -245,11 +336,14 @@ class OrderStatusUpdateSerializer(OrderSerializer):
 class ReviewSerializer(serializers.ModelSerializer):
     """Serializer for creating and listing reviews.
 
-    Validation ensures the target user is a business and prevents double
-    reviews by the same reviewer for the same business_user.
+    Validation ensures the target user is a business; double reviews by
+    the same reviewer for the same business_user are rejected in create()
+    when the uniq_review_per_business constraint fails.
     """
 
-    business_user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+    # Fetch just the id plus the annotated profile type that validate() reads
+    business_user = serializers.PrimaryKeyRelatedField(
+        queryset=User.objects.only('id').annotate(_profile_type=F('profile__type')))
     reviewer = serializers.PrimaryKeyRelatedField(read_only=True)
     rating = serializers.IntegerField(min_value=1, max_value=5)
     description = serializers.CharField()
@@ -260,34 +354,53 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'reviewer', 'created_at', 'updated_at']
 
     def validate(self, attrs):
-        request = self.context.get("request")
-        user = getattr(request, "user", None)
         business_user = attrs.get("business_user")
 
         # Ensure target is a business profile
-        if not hasattr(business_user, "profile") or business_user.profile.type != "business":
+        if getattr(business_user, "_profile_type", None) != "business":
             raise serializers.ValidationError({"business_user": "Must be a business profile."})
 
-        # Prevent duplicate reviews from the same reviewer
-        if user and Review.objects.filter(reviewer=user, business_user=business_user).exists():
-            raise serializers.ValidationError("You have already reviewed this business user.")
-
         return attrs
 
+    def create(self, validated_data):
+        # Duplicate reviews are rejected by the uniq_review_per_business constraint.
+        # The savepoint lets a failed INSERT roll back without breaking an
+        # enclosing transaction (ATOMIC_REQUESTS, tests); in autocommit it
+        # costs a BEGIN/COMMIT pair instead.
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError:
+            # Only translate the error when the pair really exists already
+            if not Review.objects.filter(
+                reviewer=validated_data.get("reviewer"),
+                business_user=validated_data.get("business_user"),
+            ).exists():
+                raise
+            raise serializers.ValidationError(
+                {"non_field_errors": ["You have already reviewed this business user."]}
+            )
+
 class ReviewPatchSerializer(ReviewSerializer):
 
+    # Fields a review PATCH may not send
+    _FORBIDDEN = frozenset(('business_user', 'reviewer'))
+
     class Meta(ReviewSerializer.Meta):
         model = Review
         fields = ['id', 'business_user', 'reviewer', 'rating', 'description', 'created_at', 'updated_at']
         read_only_fields = ['id', 'business_user', 'reviewer', 'created_at', 'updated_at']
 
-    def validate(self, attrs):
-        # When patching, forbid changes to business_user or reviewer
-        if not hasattr(self, 'initial_data') or not isinstance(self.initial_data, dict):
-            return attrs
-
-        forbidden = set(self.initial_data.keys()) & {'business_user', 'reviewer'}
-        if forbidden:
-            raise serializers.ValidationError({'non_field_errors': f"Forbidden fields: {', '.join(sorted(forbidden))}"})
+    def to_internal_value(self, data):
+        # Reject forbidden fields before any field-level coercion runs
+        if isinstance(data, dict):
+            forbidden = data.keys() & self._FORBIDDEN
+            if forbidden:
+                raise serializers.ValidationError({
+                    api_settings.NON_FIELD_ERRORS_KEY: [f"Forbidden fields: {', '.join(sorted(forbidden))}"]
+                })
+        return super().to_internal_value(data)
 
+    def validate(self, attrs):
+        # business_user is read-only here, so the create-time target check does not apply
         return attrs
@@ -1,12 +1,13 @@
 """Views for coderr_app: offers, offer details, orders and reviews.
 
-Only docstrings and short comments are added in this patch; the view
-logic and permissions remain unchanged.
+Querysets join and prefetch the relations each serializer renders, and
+the offer list loads only the columns it shows, so list endpoints run a
+constant number of queries.
 """
 
 from django.contrib.auth.models import User
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Min, Avg
+from django.db.models import Min, Avg, Prefetch
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, generics, filters
 from rest_framework.views import APIView
@@ -60,7 +61,19 @@ class OfferViewSet(viewsets.ModelViewSet):
     pagination_class = StandardResultsSetPagination
 
     def get_queryset(self):
-        queryset = Offer.objects.select_related("user").prefetch_related("details")
+        details = OfferDetail.objects.all()
+        if self.action in ("list", "retrieve"):
+            # List/detail representations only render detail id + url
+            details = details.only("id", "offer_id")
+        queryset = Offer.objects.select_related("user").prefetch_related(
+            Prefetch("details", queryset=details)
+        )
+        if self.action == "list":
+            # Skip offer/user columns the list representation never renders
+            queryset = queryset.only(
+                "id", "user", "title", "image", "description", "created_at", "updated_at",
+                "user__first_name", "user__last_name", "user__username",
+            )
         return queryset.annotate(
             min_price=Min("details__price"),
             min_delivery_time=Min("details__delivery_time_in_days"),
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-14 17:59
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_reviews(apps, schema_editor):
+    """Keep the earliest review per (reviewer, business_user) pair."""
+    Review = apps.get_model('coderr_app', 'Review')
+    duplicates = (
+        Review.objects.values('reviewer', 'business_user')
+        .annotate(keep_id=Min('id'), total=Count('id'))
+        .filter(total__gt=1)
+    )
+    for row in duplicates:
+        Review.objects.filter(
+            reviewer=row['reviewer'], business_user=row['business_user']
+        ).exclude(id=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coderr_app', '0008_review'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_reviews, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('reviewer', 'business_user'), name='uniq_review_per_business'),
+        ),
+    ]
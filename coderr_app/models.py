@@ -83,7 +83,8 @@ class Review(models.Model):
     """A review for a business user written by a reviewer (customer).
 
     Rating constraints are enforced by serializers; storing the reviewer
-    and business_user directly makes querying and aggregation easy.
+    and business_user directly makes querying and aggregation easy. A
+    reviewer may review each business user only once (unique constraint).
     """
 
     business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="received_reviews")
@@ -93,5 +94,10 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['reviewer', 'business_user'], name='uniq_review_per_business'),
+        ]
+
     def __str__(self):
         return f"Review {self.id} for {self.business_user.username} by {self.reviewer.username}"
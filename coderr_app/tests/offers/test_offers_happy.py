@@ -156,7 +156,22 @@ class OffersHappyTests(APITestCase):
         resp = self.client.get(self.list_url)
         item = resp.data["results"][0]
         self.assertEqual(item["min_price"], 50)
-        self.assertEqual(item["min_delivery_time"], 3)  
+        self.assertEqual(item["min_delivery_time"], 3)
+
+    def test_get_200_offers_list_query_count_is_constant(self):
+        for i in range(3):
+            offer = Offer.objects.create(
+                user=self.business_user, title=f"Extra {i}", description="D"
+            )
+            OfferDetail.objects.create(
+                offer=offer, title="Basic", revisions=1,
+                delivery_time_in_days=3, price=50, features=["A"], offer_type="basic"
+            )
+        # count + offers (joined with user) + details prefetch
+        with self.assertNumQueries(3):
+            resp = self.client.get(self.list_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data["results"]), 4)
 
     # --- GET Happy Offer Detail ---  
 
@@ -4,6 +4,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from copy import deepcopy
 from auth_app.models import Profile
+from coderr_app.models import Offer, OfferDetail
 
 
 class OfferValidationTests(APITestCase):
@@ -86,6 +87,11 @@ class OfferValidationTests(APITestCase):
             {**base[0], "delivery_time_in_days": 0},
             {**base[0], "price": -5},
             {**base[0], "features": "not-a-list"},
+            {**base[0], "features": []},
+            {**base[0], "features": ["A", "  "]},
+            {**base[0], "features": ["A", {"x": 1}]},
+            {**base[0], "features": [True]},
+            {**base[0], "features": ["a\x00b"]},
         ]
         for bad in bad_cases:
             with self.subTest(bad=bad):
@@ -141,6 +147,7 @@ class OfferValidationTests(APITestCase):
             {"id": detail_id, "delivery_time_in_days": 0},
             {"id": detail_id, "price": -10},
             {"id": detail_id, "features": "not-a-list"},
+            {"id": detail_id, "features": ["a\x00b"]},
         ]
         for bad in bad_cases:
             with self.subTest(bad=bad):
@@ -170,6 +177,22 @@ class OfferValidationTests(APITestCase):
         resp = self.client.patch(patch_url, {"details": new_details}, format="json")
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_patch_400_unknown_offer_type_in_detail(self):
+        post_resp = self.client.post(self.list_url, self._payload(), format="json")
+        self.assertEqual(post_resp.status_code, status.HTTP_201_CREATED)
+        offer_id = post_resp.data["id"]
+        OfferDetail.objects.filter(offer_id=offer_id, offer_type="premium").delete()
+        patch_url = reverse("offer-detail", args=[offer_id])
+
+        resp = self.client.patch(
+            patch_url,
+            {"title": "Not saved", "details": [{"offer_type": "premium", "price": 300}]},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        # The offer update is rolled back together with the failed details
+        self.assertEqual(Offer.objects.get(pk=offer_id).title, "T")
+
 
     # --- DELETE Validations ---
 
@@ -126,6 +126,18 @@ class OrderHappyTests(APITestCase):
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
         self.assertEqual(len(resp.data), 3)
 
+    def test_get_200_order_list_offer_detail_fields_single_query(self):
+        customer = User.objects.select_related("profile").get(pk=self.customer_user_1.pk)
+        self.client.force_authenticate(customer)
+
+        with self.assertNumQueries(1):
+            resp = self.client.get(self.list_url, format='json')
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(resp.data), 3)
+        for item in resp.data:
+            for key in ['title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']:
+                self.assertIn(key, item)
+
     def test_get_200_order_list_business(self):
         self.client.force_authenticate(self.business_user_1)
 
@@ -68,6 +68,19 @@ class OrderHappyTests(APITestCase):
         self.assertEqual(resp.data['rating'], 4)
         self.assertEqual(resp.data['description'], "Good job!")
 
+    def test_post_201_review_query_count(self):
+        customer = User.objects.select_related("profile").get(pk=self.customer_user_1.pk)
+        self.client.force_authenticate(customer)
+        data = {
+            "business_user": self.business_user_2.id,
+            "rating": 4,
+            "description": "Good job!"
+        }
+        # business user + profile type, then SAVEPOINT, INSERT and RELEASE
+        with self.assertNumQueries(4):
+            resp = self.client.post(self.list_url, data)
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+
     def test_get_200_reviews_list(self):
         self.client.force_authenticate(self.customer_user_1)
         resp = self.client.get(self.list_url)
@@ -87,6 +87,22 @@ class OrderHappyTests(APITestCase):
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('non_field_errors', resp.data)
 
+    def test_post_400_business_user_is_not_business(self):
+        self.client.force_authenticate(self.customer_user)
+        no_profile_user = User.objects.create_user(
+            username="no_profile_user", email="no_profile_user@example.com", password="x"
+        )
+        for target in (self.customer_user, no_profile_user):
+            with self.subTest(target=target.username):
+                data = {
+                    "business_user": target.id,
+                    "rating": 4,
+                    "description": "Super!"
+                }
+                resp = self.client.post(self.list_url, data)
+                self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('business_user', resp.data)
+
     def test_patch_400_invalid_rating(self):
         self.client.force_authenticate(self.customer_user)
         data = {
@@ -106,7 +122,7 @@ class OrderHappyTests(APITestCase):
         }
         resp = self.client.patch(self.detail_url, data)
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('non_field_errors', resp.data)
+        self.assertEqual(resp.data['non_field_errors'], ['Forbidden fields: business_user'])
 
     def test_patch_400_forbidden_field_reviewer(self):
         self.client.force_authenticate(self.customer_user)
@@ -117,7 +133,7 @@ class OrderHappyTests(APITestCase):
         }
         resp = self.client.patch(self.detail_url, data)
         self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('non_field_errors', resp.data)
+        self.assertEqual(resp.data['non_field_errors'], ['Forbidden fields: reviewer'])
 
     def test_patch_404_nonexistent_review(self):
         self.client.force_authenticate(self.customer_user)